@@ -1,28 +1,28 @@
-import sys, sysconfig
+import sys, os, sysconfig
 import copy
-import numpy
-from distutils.extension import Extension
+import multiprocessing
 from distutils.util import get_platform
-from distutils.dist import Distribution
-from distutils.command.install_lib import install_lib
 
 
-def get_openmoc_object_name():
-  """Returns the name of the main openmoc shared library object"""
+# Whether the build is for Mac OS X, and the filename suffix of extension
+# modules for this Python interpreter, which are computed once rather than
+# queried at each use
+_IS_MACOSX = get_platform()[:6] == 'macosx'
+_EXT_SUFFIX = sysconfig.get_config_var('EXT_SUFFIX') or '.so'
 
-  ext_suffix = sysconfig.get_config_var('SOABI')
 
-  if ext_suffix is None:
-    filename = '_openmoc.so'
-  else:
-    filename = '_openmoc.{0}.so'.format(ext_suffix)
+def get_openmoc_object_name():
+  """Returns the name of the main openmoc shared library object"""
 
-  return filename
+  return '_openmoc' + _EXT_SUFFIX
 
 
 def get_shared_object_path():
   """Returns the name of the distutils build directory"""
 
+  from distutils.dist import Distribution
+  from distutils.command.install_lib import install_lib
+
   install_lib_command = install_lib(Distribution())
   install_lib_command.initialize_options()
   install_lib_command.finalize_options()
@@ -69,6 +69,9 @@ class configuration:
   # Compile using ccache (for developers needing fast recompilation)
   with_ccache = False
 
+  # Number of source files to compile in parallel for each extension module
+  num_jobs = multiprocessing.cpu_count()
+
   # Compile code with debug symbols (ie, -g)
   debug_mode = False
 
@@ -76,6 +79,11 @@ class configuration:
   # modules (depending on what precision levels are set for fp_precision)
   with_cuda = False
 
+  # The NVIDIA GPU architectures to generate code for in the openmoc.cuda
+  # modules (ie, Volta, Ampere and Hopper). PTX code is also embedded for the
+  # newest architecture such that the modules run on future GPUs
+  cuda_arch = ['sm_70', 'sm_80', 'sm_86', 'sm_90']
+
   # Compile with PAPI instrumentation
   with_papi = False
 
@@ -91,9 +99,15 @@ class configuration:
   # loop from 0 to the vector length
   vector_length = 8
 
-  # The vector alignment used in the VectorizedSolver class when allocating
-  # aligned data structures using MM_MALLOC and MM_FREE
-  vector_alignment = 16
+  # The SIMD instruction set targeted by the GNU compiler: 'native' (the
+  # machine running the build), 'sse', 'avx2' or 'avx512'. An explicit
+  # instruction set should be used when distributing binaries
+  vector_isa = 'native'
+
+  # The vector alignment (in bytes) used in the VectorizedSolver class when
+  # allocating aligned data structures using MM_MALLOC and MM_FREE. This is
+  # the cache line size, which is also a multiple of the AVX/AVX-512 widths
+  vector_alignment = 64
 
   # List of C/C++/CUDA distutils.extension objects which are created based
   # on which flags are specified at compile time.
@@ -109,6 +123,15 @@ class configuration:
               'openmoc.bgq.double', 'openmoc.cuda.double',
               'openmoc.cuda.single']
 
+  # A dictionary of the openmoc subpackage (ie, openmoc.gnu) containing the
+  # extension modules built by each compiler type
+  compiler_packages = dict()
+
+  compiler_packages['gcc'] = 'gnu'
+  compiler_packages['icpc'] = 'intel'
+  compiler_packages['bgxlc'] = 'bgq'
+  compiler_packages['nvcc'] = 'cuda'
+
 
   #############################################################################
   #                                 Source Code
@@ -134,40 +157,10 @@ class configuration:
                     'src/Universe.cpp',
                     'src/Cmfd.cpp']
 
-  sources['icpc'] = ['openmoc/openmoc_wrap.cpp',
-                     'src/Cell.cpp',
-                     'src/Geometry.cpp',
-                     'src/LocalCoords.cpp',
-                     'src/log.cpp',
-                     'src/Material.cpp',
-                     'src/Point.cpp',
-                     'src/Quadrature.cpp',
-                     'src/Solver.cpp',
-                     'src/CPUSolver.cpp',
-                     'src/VectorizedSolver.cpp',
-                     'src/Surface.cpp',
-                     'src/Timer.cpp',
-                     'src/Track.cpp',
-                     'src/TrackGenerator.cpp',
-                     'src/Universe.cpp',
-                     'src/Cmfd.cpp']
-
-  sources['bgxlc'] = ['openmoc/openmoc_wrap.cpp',
-                      'src/Cell.cpp',
-                      'src/Geometry.cpp',
-                      'src/LocalCoords.cpp',
-                      'src/log.cpp',
-                      'src/Material.cpp',
-                      'src/Point.cpp',
-                      'src/Quadrature.cpp',
-                      'src/Solver.cpp',
-                      'src/CPUSolver.cpp',
-                      'src/Surface.cpp',
-                      'src/Timer.cpp',
-                      'src/Track.cpp',
-                      'src/TrackGenerator.cpp',
-                      'src/Universe.cpp',
-                      'src/Cmfd.cpp']
+  # The Intel build also includes the MKL-based VectorizedSolver while the
+  # IBM build uses the same sources as the GNU build
+  sources['icpc'] = sources['gcc'] + ['src/VectorizedSolver.cpp']
+  sources['bgxlc'] = list(sources['gcc'])
 
   sources['nvcc'] = ['openmoc/cuda/openmoc_cuda_wrap.cpp',
                      'src/accel/cuda/GPUQuery.cu',
@@ -182,17 +175,23 @@ class configuration:
   # A dictionary of the compiler flags to use for each compiler type
   compiler_flags = dict()
 
-  compiler_flags['gcc'] = ['-c', '-O3', '-ffast-math', '-fopenmp',
-                           '-std=c++0x', '-fpic']
-  compiler_flags['icpc'] =['-c', '-O3', '-fast', '--ccache-skip', '-openmp',
+  compiler_flags['gcc'] = ['-c', '-O3', '-fno-math-errno', '-fno-trapping-math',
+                           '-fopenmp', '-std=c++0x', '-fpic']
+  compiler_flags['icpc'] =['-c', '-O3', '--ccache-skip', '-openmp',
                            '-xhost', '-std=c++0x', '-fpic', '--ccache-skip',
                              '-openmp-report', '-vec-report']
   compiler_flags['bgxlc'] = ['-c', '-O2', '-qarch=qp', '-qreport',
                              '-qsimd=auto', '-qtune=qp', '-qunroll=auto',
                              '-qsmp=omp', '-qpic']
-  compiler_flags['nvcc'] =  ['-c', '-O3', '--compiler-options', '-fpic',
-                             '-gencode=arch=compute_20,code=sm_20',
-                             '-gencode=arch=compute_30,code=sm_30']
+  compiler_flags['nvcc'] =  ['-c', '-O3', '--compiler-options', '-fpic']
+
+  # A dictionary of the GNU compiler flags for each SIMD instruction set
+  vector_isa_flags = dict()
+
+  vector_isa_flags['native'] = ['-march=native', '-mtune=native']
+  vector_isa_flags['sse'] = ['-msse4.2']
+  vector_isa_flags['avx2'] = ['-mavx2', '-mfma']
+  vector_isa_flags['avx512'] = ['-mavx512f', '-mavx512dq', '-mfma']
 
 
   #############################################################################
@@ -202,7 +201,7 @@ class configuration:
   # A dictionary of the linker flags to use for each compiler type
   linker_flags = dict()
 
-  if (get_platform()[:6] == 'macosx'):
+  if _IS_MACOSX:
     linker_flags['gcc'] = ['-fopenmp', '-dynamiclib', '-lpython2.7',
                            '-Wl,-install_name,' + get_openmoc_object_name()]
   else:
@@ -214,7 +213,7 @@ class configuration:
   linker_flags['bgxlc'] = ['-qmkshrobj', '-shared',
                            '-R/soft/compilers/ibmcmp-may2013/lib64/bg/bglib64',
                            '-Wl,-soname,' + get_openmoc_object_name()]
-  linker_flags['nvcc'] = ['-shared', get_openmoc()]
+  linker_flags['nvcc'] = ['-shared']
 
 
   #############################################################################
@@ -265,73 +264,61 @@ class configuration:
   #                                 SWIG Flags
   ###########################################################################
 
-  # A list of the flags for SWIG
-  swig_flags = ['-c++', '-python', '-keyword'] #, '-keyword', '-py3']
+  # A list of the flags for SWIG. The -O flag enables SWIG's optimizations
+  # (ie, -fastdispatch, -fastproxy and -fvirtual) of the Python wrappers
+  swig_flags = ['-c++', '-python', '-O', '-keyword'] #, '-keyword', '-py3']
 
 
   #############################################################################
   #                                  Macros
   #############################################################################
 
+  # A dictionary of the macros to set at compile time for each floating
+  # point precision level
+  precision_macros = dict()
+
+  precision_macros['single'] = [('FP_PRECISION', 'float'),
+                                ('SINGLE', None)]
+
+  precision_macros['double'] = [('FP_PRECISION', 'double'),
+                                ('DOUBLE', None)]
+
   # A dictionary of the macros to set at compile time for each compiler type
-  # and floating point precisin level
+  # in addition to those for the floating point precision level
   macros = dict()
 
-  macros['gcc'] = dict()
-  macros['icpc'] = dict()
-  macros['bgxlc'] = dict()
-  macros['nvcc'] = dict()
-
-  macros['gcc']['single']= [('FP_PRECISION', 'float'),
-                            ('SINGLE', None),
-                            ('GNU', None),
-                            ('VEC_LENGTH', vector_length),
-                            ('VEC_ALIGNMENT', vector_alignment)]
-
-  macros['icpc']['single']= [('FP_PRECISION', 'float'),
-                             ('SINGLE', None),
-                             ('INTEL', None),
-                             ('MKL_ILP64', None),
-                             ('VEC_LENGTH', vector_length),
-                             ('VEC_ALIGNMENT', vector_alignment)]
-
-  macros['bgxlc']['single'] = [('FP_PRECISION', 'float'),
-                               ('SINGLE', None),
-                               ('BGXLC', None),
-                               ('VEC_LENGTH', vector_length),
-                               ('VEC_ALIGNMENT', vector_alignment),
-                               ('CCACHE_CC', 'bgxlc++_r')]
-
-  macros['nvcc']['single'] = [('FP_PRECISION', 'float'),
-                              ('SINGLE', None),
-                              ('CUDA', None),
-                              ('CCACHE_CC', 'nvcc')]
-
-  macros['gcc']['double'] = [('FP_PRECISION', 'double'),
-                             ('DOUBLE', None),
-                             ('GNU', None),
-                             ('VEC_LENGTH', vector_length),
-                             ('VEC_ALIGNMENT', vector_alignment)]
-
-  macros['icpc']['double'] = [('FP_PRECISION', 'double'),
-                              ('DOUBLE', None),
-                              ('INTEL', None),
-                              ('MKL_ILP64', None),
-                              ('VEC_LENGTH', vector_length),
-                              ('VEC_ALIGNMENT', vector_alignment)]
-
-  macros['bgxlc']['double'] = [('FP_PRECISION', 'double'),
-                               ('DOUBLE', None),
-                               ('BGXLC', None),
-                               ('VEC_LENGTH', vector_length),
-                               ('VEC_ALIGNMENT', vector_alignment),
-                               ('CCACHE_CC', 'bgxlc++_r')]
-
-  macros['nvcc']['double'] = [('FP_PRECISION', 'double'),
-                              ('DOUBLE', None),
-                              ('CUDA', None),
-                              ('CCACHE_CC', 'nvcc')]
+  macros['gcc'] = [('GNU', None),
+                   ('VEC_LENGTH', vector_length),
+                   ('VEC_ALIGNMENT', vector_alignment),
+                   ('CCACHE_CC', 'gcc')]
+
+  macros['icpc'] = [('INTEL', None),
+                    ('MKL_ILP64', None),
+                    ('VEC_LENGTH', vector_length),
+                    ('VEC_ALIGNMENT', vector_alignment),
+                    ('CCACHE_CC', 'icpc')]
+
+  macros['bgxlc'] = [('BGXLC', None),
+                     ('VEC_LENGTH', vector_length),
+                     ('VEC_ALIGNMENT', vector_alignment),
+                     ('CCACHE_CC', 'bgxlc++_r')]
 
+  macros['nvcc'] = [('CUDA', None),
+                    ('CCACHE_CC', 'nvcc')]
+
+
+
+  def __init__(self):
+    """Copies the default options into this configuration.
+
+    The lists and dictionaries of options defined for the class are
+    copied such that setup_extension_modules may modify them in place
+    without changing the defaults for other configuration instances.
+    """
+
+    for name, value in vars(configuration).items():
+      if isinstance(value, (list, dict)):
+        setattr(self, name, copy.deepcopy(value))
 
 
   def setup_extension_modules(self):
@@ -341,6 +328,9 @@ class configuration:
     Python package based on the user-defined flags defined at compile time.
     """
 
+    # Only import the distutils extension machinery when building
+    from distutils.extension import Extension
+
     # If the user selected 'all' compilers, enumerate them
     if self.cpp_compilers == ['all']:
       self.cpp_compilers = ['gcc', 'icpc', 'nvcc']
@@ -349,12 +339,76 @@ class configuration:
     if self.fp_precision == ['all']:
       self.fp_precision = ['double', 'single']
 
+    # Generate code for each of the requested NVIDIA GPU architectures
+    for arch in self.cuda_arch:
+      self.compiler_flags['nvcc'].append(
+          '-gencode=arch=compute_{0},code=sm_{0}'.format(arch[3:]))
+
+    if self.cuda_arch:
+      self.compiler_flags['nvcc'].append(
+          '-gencode=arch=compute_{0},code=compute_{0}'.format(
+              self.cuda_arch[-1][3:]))
+
+    # Target the requested SIMD instruction set with the GNU compiler
+    if self.vector_isa not in self.vector_isa_flags:
+      raise NameError('Vector instruction set ' + str(self.vector_isa) +
+                      ' is not supported')
+
+    self.compiler_flags['gcc'] += self.vector_isa_flags[self.vector_isa]
+
+    # Place each function and datum in its own section such that the linker
+    # may discard those which are unused, and do not export inline functions
+    self.compiler_flags['gcc'] += ['-ffunction-sections', '-fdata-sections',
+                                   '-fvisibility-inlines-hidden']
+
+    if _IS_MACOSX:
+      self.linker_flags['gcc'] += ['-Wl,-dead_strip']
+    else:
+      self.linker_flags['gcc'] += ['-Wl,--gc-sections']
+
+    # Only export the SWIG module initialization functions from the shared
+    # objects, unless the openmoc.cuda module is built since it is linked
+    # against the C++ symbols in the main openmoc module
+    if not self.with_cuda:
+      self.compiler_flags['gcc'] += ['-fvisibility=hidden']
+      self.compiler_flags['icpc'] += ['-fvisibility=hidden']
+
     # If the user wishes to compile using debug mode, append the debugging
     # flag to all lists of compiler flags for all distribution types
     if self.debug_mode:
       for k in self.compiler_flags:
         self.compiler_flags[k].append('-g')
 
+    # Otherwise, enable link-time (interprocedural) optimization such that
+    # small accessors may be inlined across source files. The GNU objects
+    # are kept fat since the CUDA module's SWIG wrapper is compiled with the
+    # GNU flags but linked by nvcc without LTO
+    else:
+      self.compiler_flags['gcc'] += ['-flto', '-ffat-lto-objects']
+      self.compiler_flags['icpc'] += ['-ipo']
+      self.compiler_flags['bgxlc'] += ['-qipa=level=2']
+
+      self.linker_flags['gcc'] += ['-flto']
+      self.linker_flags['icpc'] += ['-ipo']
+      self.linker_flags['bgxlc'] += ['-qipa=level=2']
+
+      if not _IS_MACOSX:
+        self.linker_flags['gcc'] += ['-fuse-linker-plugin']
+
+    # If the user wishes to compile using ccache, make the cache hashes
+    # independent of the absolute path of the (randomly named) distutils
+    # build directories and of the source file timestamps
+    if self.with_ccache:
+      os.environ['CCACHE_BASEDIR'] = os.getcwd()
+      os.environ['CCACHE_SLOPPINESS'] = 'time_macros,include_file_mtime'
+
+    # Otherwise, remove the ccache-specific flags which would otherwise be
+    # passed straight through to the compiler
+    else:
+      for k in self.compiler_flags:
+        self.compiler_flags[k] = \
+            [flag for flag in self.compiler_flags[k] if flag != '--ccache-skip']
+
     # If the user passed in the --no-numpy flag, tell SWIG not to embed
     # NumPy typemaps in the source code
     if not self.with_numpy:
@@ -362,6 +416,8 @@ class configuration:
 
     # Otherwise, obtain the NumPy include directory
     else:
+      import numpy
+
       try:
         numpy_include = numpy.get_include()
 
@@ -377,12 +433,13 @@ class configuration:
     # The main openmoc extension (defaults are gcc and single precision)
     self.extensions.append(
       Extension(name = '_openmoc',
-                sources = copy.deepcopy(self.sources[self.cc]),
+                sources = list(self.sources[self.cc]),
                 library_dirs = self.library_directories[self.cc],
                 libraries = self.shared_libraries[self.cc],
                 extra_link_args = self.linker_flags[self.cc],
                 include_dirs = self.include_directories[self.cc],
-                define_macros = self.macros[self.cc][self.fp],
+                define_macros = self.precision_macros[self.fp] + \
+                                self.macros[self.cc],
                 swig_opts = self.swig_flags + ['-D' + self.cc.upper()]))
 
     # The openmoc.cuda extension if requested by the user at compile
@@ -391,14 +448,18 @@ class configuration:
 
       self.cpp_compilers.append('nvcc')
 
+      # Link the openmoc.cuda module against the main openmoc module
+      self.linker_flags['nvcc'].append(get_openmoc())
+
       self.extensions.append(
         Extension(name = '_openmoc_cuda',
-                  sources = copy.deepcopy(self.sources['nvcc']),
+                  sources = list(self.sources['nvcc']),
                   library_dirs = self.library_directories['nvcc'],
                   libraries = self.shared_libraries['nvcc'],
                   extra_link_args = self.linker_flags['nvcc'],
                   include_dirs = self.include_directories['nvcc'],
-                  define_macros = self.macros['nvcc'][self.fp],
+                  define_macros = self.precision_macros[self.fp] + \
+                                  self.macros['nvcc'],
                   swig_opts = self.swig_flags  + ['-DNVCC'],
                   export_symbols = ['init_openmoc']))
 
@@ -412,52 +473,32 @@ class configuration:
     for fp in self.fp_precision:
       for cc in self.cpp_compilers:
 
-        # Build the filename for the SWIG configuration file and the
-        # extension name depending on the compiler and floating
-        # point precision
-
-        # For openmoc.cuda.* modules
-        if cc == 'nvcc':
-          ext_name = '_openmoc_cuda_' + fp
-          swig_wrap_file = 'openmoc/cuda/' + fp
-          swig_wrap_file += '/openmoc_cuda_' + fp + '_wrap.cpp'
-          self.sources['nvcc'].append(swig_wrap_file)
-
-        # For openmoc.gnu.* modules
-        elif cc == 'gcc':
-          ext_name = '_openmoc_gnu_' + fp
-          swig_wrap_file = 'openmoc/gnu/' + fp
-          swig_wrap_file += '/openmoc_gnu_' + fp + '_wrap.cpp'
-          self.sources['gcc'].append(swig_wrap_file)
-
-      # For openmoc.intel.* modules
-        elif cc == 'icpc':
-          ext_name = '_openmoc_intel_' + fp
-          swig_wrap_file = 'openmoc/intel/' + fp
-          swig_wrap_file += '/openmoc_intel_' + fp + '_wrap.cpp'
-          self.sources['icpc'].append(swig_wrap_file)
-
-        # For openmoc.intel.* modules
-        elif cc == 'bgxlc':
-          ext_name = '_openmoc_bgq_' + fp
-          swig_wrap_file = 'openmoc/bgq/' + fp
-          swig_wrap_file += '/openmoc_bgq_' + fp + '_wrap.cpp'
-          self.sources['bgxlc'].append(swig_wrap_file)
-
         # If an unsupported compiler, throw error
-        else:
+        if cc not in self.compiler_packages:
           raise NameError('Compiler ' + str(cc) + ' is not supported')
 
+        # Build the filename for the SWIG configuration file and the
+        # extension name depending on the compiler and floating
+        # point precision (ie, openmoc/gnu/single/openmoc_gnu_single_wrap.cpp
+        # and _openmoc_gnu_single for the openmoc.gnu.single module)
+        package = self.compiler_packages[cc]
+        ext_name = '_openmoc_{0}_{1}'.format(package, fp)
+        swig_wrap_file = os.path.join(
+            'openmoc', package, fp,
+            'openmoc_{0}_{1}_wrap.cpp'.format(package, fp))
+        self.sources[cc].append(swig_wrap_file)
+
         # Create the extension module and append it to the list of all
         # extension modules
         self.extensions.append(
           Extension(name = ext_name,
-                    sources = copy.deepcopy(self.sources[cc]),
+                    sources = list(self.sources[cc]),
                     library_dirs = self.library_directories[cc],
                     libraries = self.shared_libraries[cc],
                     extra_link_args = self.linker_flags[cc],
                     include_dirs = self.include_directories[cc],
-                    define_macros = self.macros[cc][fp],
+                    define_macros = self.precision_macros[fp] + \
+                                    self.macros[cc],
                     swig_opts = self.swig_flags + ['-D' + cc.upper()]))
 
         # Clean up - remove the SWIG-generated wrap file from this
@@ -1 +1,8 @@
-from casmo import *
+import sys
+
+# For Python 2.X.X
+if (sys.version_info[0] == 2):
+  from casmo import *
+# For Python 3.X.X
+else:
+  from openmoc.compatible.casmo import *
@@ -242,10 +242,96 @@
  * getCellIds method for the data processing routines in openmoc.process */
 %apply (int* ARGOUT_ARRAY1, int DIM1) {(int* cell_ids, int num_cells)}
 
+/* The typemap used to match the method signature for the Material's
+ * retrieveSigmaS method to retrieve the scattering matrix as a NumPy array */
+%apply (double* ARGOUT_ARRAY1, int DIM1) {(double* sigma_s, int num_xs)}
+
 #endif
 
 
+/* Typemap for Cell::addSurfaces(Surface** surfaces, int* halfspaces,
+ * int num_surfaces) method - allows users to pass in a Python list of
+ * (halfspace, Surface) pairs to add to a Cell with a single call */
+%typemap(in) (Surface** surfaces, int* halfspaces, int num_surfaces) {
+
+  if (!PyList_Check($input)) {
+    PyErr_SetString(PyExc_ValueError,"Expected a Python list of (halfspace, "
+                    "Surface) pairs for the Cell surfaces");
+    return NULL;
+  }
+
+  $3 = PySequence_Length($input);  // num_surfaces
+  $1 = (Surface**) malloc($3 * sizeof(Surface*));  // surfaces
+  $2 = (int*) malloc($3 * sizeof(int));  // halfspaces
+
+  /* Loop over the (halfspace, Surface) pairs */
+  for (int i = 0; i < $3; i++) {
+
+    PyObject* pair = PySequence_GetItem($input,i);
+    void* surface = NULL;
+
+    /* Check that this is a pair of a number and a Surface */
+    if (!PySequence_Check(pair) || PySequence_Length(pair) != 2) {
+      Py_XDECREF(pair);
+      free($1);
+      free($2);
+      PyErr_SetString(PyExc_ValueError,"Expected a list of (halfspace, "
+                      "Surface) pairs when adding Surfaces to a Cell\n");
+      return NULL;
+    }
+
+    PyObject* halfspace = PySequence_GetItem(pair,0);
+    PyObject* surf = PySequence_GetItem(pair,1);
+
+    if (!PyNumber_Check(halfspace) ||
+        !SWIG_IsOK(SWIG_ConvertPtr(surf, &surface, $descriptor(Surface*), 0))) {
+      Py_DECREF(halfspace);
+      Py_DECREF(surf);
+      Py_DECREF(pair);
+      free($1);
+      free($2);
+      PyErr_SetString(PyExc_ValueError,"Expected a list of (halfspace, "
+                      "Surface) pairs when adding Surfaces to a Cell\n");
+      return NULL;
+    }
+
+    $1[i] = reinterpret_cast<Surface*>(surface);
+    $2[i] = (int) PyLong_AsLong(halfspace);
+
+    Py_DECREF(halfspace);
+    Py_DECREF(surf);
+    Py_DECREF(pair);
+
+    /* Check that the halfspace was converted to an integer */
+    if (PyErr_Occurred()) {
+      free($1);
+      free($2);
+      PyErr_SetString(PyExc_ValueError,"Expected an integer halfspace (+/-1) "
+                      "for each Surface added to a Cell\n");
+      return NULL;
+    }
+  }
+}
+
+%typemap(freearg) (Surface** surfaces, int* halfspaces, int num_surfaces) {
+  free($1);
+  free($2);
+}
+
+
 %include <exception.i>
+
+/* Templates used to match the method signatures for the Geometry's
+ * addMaterials, addCells and addLattices methods. These allow users to pass
+ * in Python lists of Materials, Cells and Lattices to add with a single call.
+ * Keyword arguments are disabled for the overloaded std::vector methods. */
+%feature("kwargs", "0");
+%include <std_vector.i>
+%template(MaterialVector) std::vector<Material*>;
+%template(CellVector) std::vector<Cell*>;
+%template(LatticeVector) std::vector<Lattice*>;
+%feature("kwargs", "1");
+
 %include ../../../src/Cell.h
 %include ../../../src/Geometry.h
 %include ../../../src/LocalCoords.h
@@ -12,8 +12,14 @@
 # openmoc module used in the main Python input script to OpenMOC.
 
 
-import sys
-from process import *
+import sys, os
+
+# For Python 2.X.X
+if (sys.version_info[0] == 2):
+  from process import *
+# For Python 3.X.X
+else:
+  from openmoc.process import *
 
 ## @var openmoc
 #  @brief The openmoc module in use in the Python script using the
@@ -44,6 +50,36 @@ else:
 
 
 
+##
+# @brief Imports a Python source file as a module and caches it.
+# @details The module is stored in sys.modules under the absolute path of the
+#          file so that repeated calls for the same file, even when given by
+#          different relative paths, do not re-execute its source.
+# @param filename the path to the Python source file
+# @return the imported module
+def _load_source(filename):
+
+  filename = os.path.abspath(filename)
+
+  if filename in sys.modules:
+    return sys.modules[filename]
+
+  # For Python 2.X.X
+  if (sys.version_info[0] == 2):
+    import imp
+    return imp.load_source(filename, filename)
+
+  # For Python 3.X.X
+  import importlib.util
+
+  spec = importlib.util.spec_from_file_location(filename, filename)
+  module = importlib.util.module_from_spec(spec)
+  spec.loader.exec_module(module)
+  sys.modules[filename] = module
+
+  return module
+
+
 
 ##
 # @brief This routine takes in an input file of Material nuclear data and
@@ -104,31 +140,34 @@ def materialize(filename):
       new_material = openmoc.Material(openmoc.material_id())
       new_material.setNumEnergyGroups(int(num_groups))
 
-      # Retrieve and load the cross-section data into the material object
+      # Retrieve and load the cross-section data into the material object.
+      # Each dataset is read into a NumPy array with a single bulk read and
+      # passed to the Material's array setter in one call
+      material_data = f[name]
 
-      if 'Total XS' in f[name]:
-        new_material.setSigmaT(f[name]['Total XS'][...])
+      if 'Total XS' in material_data:
+        new_material.setSigmaT(material_data['Total XS'][...])
 
-      if 'Scattering XS' in f[name]:
-        new_material.setSigmaS(f[name]['Scattering XS'][...])
+      if 'Scattering XS' in material_data:
+        new_material.setSigmaS(material_data['Scattering XS'][...])
 
-      if 'Fission XS' in f[name]:
-        new_material.setSigmaF(f[name]['Fission XS'][...])
+      if 'Fission XS' in material_data:
+        new_material.setSigmaF(material_data['Fission XS'][...])
 
-      if 'Nu Fission XS' in f[name]:
-        new_material.setNuSigmaF(f[name]['Nu Fission XS'][...])
+      if 'Nu Fission XS' in material_data:
+        new_material.setNuSigmaF(material_data['Nu Fission XS'][...])
 
-      if 'Chi' in f[name]:
-        new_material.setChi(f[name]['Chi'][...])
+      if 'Chi' in material_data:
+        new_material.setChi(material_data['Chi'][...])
 
-      if 'Diffusion Coefficient' in f[name]:
-        new_material.setDifCoef(f[name]['Diffusion Coefficient'][...])
+      if 'Diffusion Coefficient' in material_data:
+        new_material.setDifCoef(material_data['Diffusion Coefficient'][...])
 
-      if 'Buckling' in f[name]:
-        new_material.setBuckling(f[name]['Buckling'][...])
+      if 'Buckling' in material_data:
+        new_material.setBuckling(material_data['Buckling'][...])
 
-      if 'Absorption XS' in f[name]:
-        new_material.setSigmaA(f[name]['Absorption XS'][...])
+      if 'Absorption XS' in material_data:
+        new_material.setSigmaA(material_data['Absorption XS'][...])
 
       # Make sure this Material's cross-sections add up to
       # its total cross-section
@@ -137,23 +176,22 @@ def materialize(filename):
       # Add this material to the list
       materials[name] = new_material
 
+    f.close()
+
 
   ##############################################################################
   #                      PYTHON DICTIONARY DATA FILES
   ##############################################################################
   elif filename.endswith('.py'):
 
-    import imp
-    
-    
     try:
-      data = imp.load_source(filename, filename).dataset
+      data = _load_source(filename).dataset
     except IOError:
       py_printf('ERROR', 'Unable to materialize file %s because it ' + \
                   'cannot be opened.  Check the file path.',filename)
 
     # Check that the file has an 'energy groups' attribute
-    if not 'Energy Groups' in data.keys():
+    if not 'Energy Groups' in data:
       py_printf('ERROR', 'Unable to materialize file %s since it does not ' + \
                 'contain an \'Energy Groups\' attribute', filename)
 
@@ -175,29 +213,31 @@ def materialize(filename):
       new_material = openmoc.Material(openmoc.material_id())
       new_material.setNumEnergyGroups(int(num_groups))
 
-      if 'Total XS' in data[name].keys():
-        new_material.setSigmaT(data[name]['Total XS'])
+      material_data = data[name]
+
+      if 'Total XS' in material_data:
+        new_material.setSigmaT(material_data['Total XS'])
 
-      if 'Scattering XS' in data[name].keys():
-        new_material.setSigmaS(data[name]['Scattering XS'])
+      if 'Scattering XS' in material_data:
+        new_material.setSigmaS(material_data['Scattering XS'])
 
-      if 'Fission XS' in data[name].keys():
-        new_material.setSigmaF(data[name]['Fission XS'])
+      if 'Fission XS' in material_data:
+        new_material.setSigmaF(material_data['Fission XS'])
 
-      if 'Nu Fission XS' in data[name].keys():
-        new_material.setNuSigmaF(data[name]['Nu Fission XS'])
+      if 'Nu Fission XS' in material_data:
+        new_material.setNuSigmaF(material_data['Nu Fission XS'])
 
-      if 'Chi' in data[name].keys():
-        new_material.setChi(data[name]['Chi'])
+      if 'Chi' in material_data:
+        new_material.setChi(material_data['Chi'])
 
-      if 'Diffusion Coefficient' in data[name].keys():
-        new_material.setDifCoef(data[name]['Diffusion Coefficient'])
+      if 'Diffusion Coefficient' in material_data:
+        new_material.setDifCoef(material_data['Diffusion Coefficient'])
 
-      if 'Buckling' in data[name].keys():
-        new_material.setBuckling(data[name]['Buckling'])
+      if 'Buckling' in material_data:
+        new_material.setBuckling(material_data['Buckling'])
 
-      if 'Absorption XS' in data[name].keys():
-        new_material.setSigmaA(data[name]['Absorption XS'])
+      if 'Absorption XS' in material_data:
+        new_material.setSigmaA(material_data['Absorption XS'])
 
       # Add this material to the list
       materials[name] = new_material
@@ -41,6 +41,7 @@ if (sys.version_info[0] == 2):
 # For Python 3.X.X
 else:
   from openmoc.log import *
+  long = int
 
 
 ## 
@@ -166,7 +167,8 @@ def compute_fission_rates(solver, use_hdf5=False):
     import pickle
 
     # Pickle the fission rates to a file
-    pickle.dump(fission_rates_sum, open(directory + filename + '.pkl', 'wb'))
+    with open(directory + filename + '.pkl', 'wb') as f:
+      pickle.dump(fission_rates_sum, f)
     
 
 ##
@@ -277,7 +279,7 @@ def store_simulation_state(solver, fluxes=False, sources=False,
   tot_time = solver.getTotalTime()
   keff = solver.getKeff()
 
-  if solver_type is 'GPUSolver':
+  if solver_type == 'GPUSolver':
     num_threads = solver.getNumThreadsPerBlock()
     num_blocks = solver.getNumThreadBlocks()
   else:
@@ -289,10 +291,13 @@ def store_simulation_state(solver, fluxes=False, sources=False,
     # Allocate array
     scalar_fluxes = np.zeros((num_FSRs, num_groups))
 
-    # Get the scalar flux for each FSR and energy group
+    # Get the scalar flux for each FSR and energy group, looking up the
+    # SWIG-wrapped method once rather than for each FSR and group
+    get_scalar_flux = solver.getFSRScalarFlux
+
     for i in range(num_FSRs):
       for j in range(num_groups):
-        scalar_fluxes[i,j] = solver.getFSRScalarFlux(i,j+1)
+        scalar_fluxes[i,j] = get_scalar_flux(i,j+1)
 
   # If the user requested to store the FSR sources
   if sources:
@@ -300,10 +305,12 @@ def store_simulation_state(solver, fluxes=False, sources=False,
     # Allocate array
     sources_array = np.zeros((num_FSRs, num_groups))
 
-    # Get the scalar flux for each FSR and energy group
+    # Get the source for each FSR and energy group
+    get_source = solver.getFSRSource
+
     for i in range(num_FSRs):
       for j in range(num_groups):
-        sources_array[i,j] = solver.getFSRSource(i,j+1)
+        sources_array[i,j] = get_source(i,j+1)
 
   # If using HDF5
   if use_hdf5:
@@ -321,7 +328,7 @@ def store_simulation_state(solver, fluxes=False, sources=False,
     time_group = day_group.create_group(str(hr)+':'+str(mins)+':'+str(sec))
 
     # Store a note for this simulation state
-    if not note is '':
+    if note != '':
       time_group.attrs['note'] = note
 
     # Store simulation data to the HDF5 file
@@ -342,7 +349,7 @@ def store_simulation_state(solver, fluxes=False, sources=False,
     time_group.create_dataset('time [sec]', data=tot_time)
     time_group.create_dataset('keff', data=keff)
 
-    if solver_type is 'GPUSolver':
+    if solver_type == 'GPUSolver':
       time_group.create_dataset('# threads per block', data=num_threads)
       time_group.create_dataset('# thread blocks', data=num_blocks)
     else:
@@ -378,7 +385,8 @@ def store_simulation_state(solver, fluxes=False, sources=False,
     # Load the dictionary from the Pickle file
     filename = directory + '/' + filename + '.pkl'
     if os.path.exists(filename) and append:
-      sim_states = pickle.load(file(filename, 'rb'))
+      with open(filename, 'rb') as f:
+        sim_states = pickle.load(f)
     else:
       sim_states = {}
 
@@ -387,14 +395,14 @@ def store_simulation_state(solver, fluxes=False, sources=False,
     time = str(hr)+':'+str(mins)+':'+str(sec)
 
     # Create dictionaries for this day and time within the pickled file
-    if not day in sim_states.keys():
+    if not day in sim_states:
       sim_states[day] = {}
 
     sim_states[day][time] = {}
     state = sim_states[day][time]
 
     # Store a note for this simulation state
-    if not note is '':
+    if note != '':
       state['note'] = note
 
     # Store simulation data to a Python dictionary
@@ -415,7 +423,7 @@ def store_simulation_state(solver, fluxes=False, sources=False,
     state['time [sec]'] = tot_time
     state['keff'] = keff
 
-    if solver_type is 'GPUSolver':
+    if solver_type == 'GPUSolver':
       state['# threads per block'] = num_threads
       state['# thread blocks'] = num_blocks
     else:
@@ -429,13 +437,12 @@ def store_simulation_state(solver, fluxes=False, sources=False,
 
     if fission_rates:
       compute_fission_rates(solver, False)      
-      state['fission-rates'] = pickle.load(file('fission-rates/fission-rates.pkl', 'rb'))
-
-    # Pickle the simulation states to a file
-    pickle.dump(sim_states, open(filename, 'wb'))
+      with open('fission-rates/fission-rates.pkl', 'rb') as f:
+        state['fission-rates'] = pickle.load(f)
 
     # Pickle the simulation states to a file
-    pickle.dump(sim_states, open(filename, 'wb'))
+    with open(filename, 'wb') as f:
+      pickle.dump(sim_states, f)
 
 
 ##
@@ -546,7 +553,7 @@ def restore_simulation_state(filename='simulation-state.h5',
         keff =  float(dataset['keff'][...])
         state['keff'] = keff
 
-        if solver_type is 'GPUSolver':
+        if solver_type == 'GPUSolver':
           num_threads = int(dataset['# threads per block'])
           num_blocks = int(dataset['# thread blocks'])
         else:
@@ -577,7 +584,8 @@ def restore_simulation_state(filename='simulation-state.h5',
 
     # Load the dictionary from the pickle file
     filename = directory + '/' + filename
-    states = pickle.load(file(filename, 'rb'))
+    with open(filename, 'rb') as f:
+      states = pickle.load(f)
 
     return states
 
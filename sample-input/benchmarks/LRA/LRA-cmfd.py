@@ -1,6 +1,6 @@
+import numpy
 from openmoc import *
 import openmoc.log as log
-import openmoc.plotter as plotter
 import openmoc.materialize as materialize
 from openmoc.options import Options
 
@@ -75,10 +75,8 @@ cells.append(CellFill(universe=25, universe_fill=35))
 cells.append(CellFill(universe=26, universe_fill=36))
 cells.append(CellFill(universe=0, universe_fill=7))
 
-cells[12].addSurface(halfspace=+1, surface=planes[0])
-cells[12].addSurface(halfspace=-1, surface=planes[1])
-cells[12].addSurface(halfspace=+1, surface=planes[2])
-cells[12].addSurface(halfspace=-1, surface=planes[3])
+cells[12].addSurfaces([(+1, planes[0]), (-1, planes[1]),
+                       (+1, planes[2]), (-1, planes[3])])
 
 
 ###############################################################################
@@ -88,78 +86,24 @@ cells[12].addSurface(halfspace=-1, surface=planes[3])
 log.py_printf('NORMAL', 'Creating LRA lattice...')
 
 assembly1 = Lattice(id=31, width_x=1.5, width_y=1.5)
-assembly1.setLatticeCells([[1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-                           [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-                           [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-                           [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-                           [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-                           [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-                           [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-                           [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-                           [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-                           [1, 1, 1, 1, 1, 1, 1, 1, 1, 1]])
+assembly1.setLatticeCells(numpy.full((10, 10), 1).tolist())
 
 assembly2 = Lattice(id=32, width_x=1.5, width_y=1.5)
-assembly2.setLatticeCells([[2, 2, 2, 2, 2, 2, 2, 2, 2, 2],
-                           [2, 2, 2, 2, 2, 2, 2, 2, 2, 2],
-                           [2, 2, 2, 2, 2, 2, 2, 2, 2, 2],
-                           [2, 2, 2, 2, 2, 2, 2, 2, 2, 2],
-                           [2, 2, 2, 2, 2, 2, 2, 2, 2, 2],
-                           [2, 2, 2, 2, 2, 2, 2, 2, 2, 2],
-                           [2, 2, 2, 2, 2, 2, 2, 2, 2, 2],
-                           [2, 2, 2, 2, 2, 2, 2, 2, 2, 2],
-                           [2, 2, 2, 2, 2, 2, 2, 2, 2, 2],
-                           [2, 2, 2, 2, 2, 2, 2, 2, 2, 2]])
+assembly2.setLatticeCells(numpy.full((10, 10), 2).tolist())
 
 assembly3 = Lattice(id=33, width_x=1.5, width_y=1.5)
-assembly3.setLatticeCells([[3, 3, 3, 3, 3, 3, 3, 3, 3, 3],
-                           [3, 3, 3, 3, 3, 3, 3, 3, 3, 3],
-                           [3, 3, 3, 3, 3, 3, 3, 3, 3, 3],
-                           [3, 3, 3, 3, 3, 3, 3, 3, 3, 3],
-                           [3, 3, 3, 3, 3, 3, 3, 3, 3, 3],
-                           [3, 3, 3, 3, 3, 3, 3, 3, 3, 3],
-                           [3, 3, 3, 3, 3, 3, 3, 3, 3, 3],
-                           [3, 3, 3, 3, 3, 3, 3, 3, 3, 3],
-                           [3, 3, 3, 3, 3, 3, 3, 3, 3, 3],
-                           [3, 3, 3, 3, 3, 3, 3, 3, 3, 3]])
+assembly3.setLatticeCells(numpy.full((10, 10), 3).tolist())
 
 
 assembly4 = Lattice(id=34, width_x=1.5, width_y=1.5)
-assembly4.setLatticeCells([[4, 4, 4, 4, 4, 4, 4, 4, 4, 4],
-                           [4, 4, 4, 4, 4, 4, 4, 4, 4, 4],
-                           [4, 4, 4, 4, 4, 4, 4, 4, 4, 4],
-                           [4, 4, 4, 4, 4, 4, 4, 4, 4, 4],
-                           [4, 4, 4, 4, 4, 4, 4, 4, 4, 4],
-                           [4, 4, 4, 4, 4, 4, 4, 4, 4, 4],
-                           [4, 4, 4, 4, 4, 4, 4, 4, 4, 4],
-                           [4, 4, 4, 4, 4, 4, 4, 4, 4, 4],
-                           [4, 4, 4, 4, 4, 4, 4, 4, 4, 4],
-                           [4, 4, 4, 4, 4, 4, 4, 4, 4, 4]])
+assembly4.setLatticeCells(numpy.full((10, 10), 4).tolist())
 
 assembly5 = Lattice(id=35, width_x=1.5, width_y=1.5)
-assembly5.setLatticeCells([[5, 5, 5, 5, 5, 5, 5, 5, 5, 5],
-                           [5, 5, 5, 5, 5, 5, 5, 5, 5, 5],
-                           [5, 5, 5, 5, 5, 5, 5, 5, 5, 5],
-                           [5, 5, 5, 5, 5, 5, 5, 5, 5, 5],
-                           [5, 5, 5, 5, 5, 5, 5, 5, 5, 5],
-                           [5, 5, 5, 5, 5, 5, 5, 5, 5, 5],
-                           [5, 5, 5, 5, 5, 5, 5, 5, 5, 5],
-                           [5, 5, 5, 5, 5, 5, 5, 5, 5, 5],
-                           [5, 5, 5, 5, 5, 5, 5, 5, 5, 5],
-                           [5, 5, 5, 5, 5, 5, 5, 5, 5, 5]])
+assembly5.setLatticeCells(numpy.full((10, 10), 5).tolist())
 
 
 assembly6 = Lattice(id=36, width_x=1.5, width_y=1.5)
-assembly6.setLatticeCells([[6, 6, 6, 6, 6, 6, 6, 6, 6, 6],
-                           [6, 6, 6, 6, 6, 6, 6, 6, 6, 6],
-                           [6, 6, 6, 6, 6, 6, 6, 6, 6, 6],
-                           [6, 6, 6, 6, 6, 6, 6, 6, 6, 6],
-                           [6, 6, 6, 6, 6, 6, 6, 6, 6, 6],
-                           [6, 6, 6, 6, 6, 6, 6, 6, 6, 6],
-                           [6, 6, 6, 6, 6, 6, 6, 6, 6, 6],
-                           [6, 6, 6, 6, 6, 6, 6, 6, 6, 6],
-                           [6, 6, 6, 6, 6, 6, 6, 6, 6, 6],
-                           [6, 6, 6, 6, 6, 6, 6, 6, 6, 6]])
+assembly6.setLatticeCells(numpy.full((10, 10), 6).tolist())
 
 
 core = Lattice(id=7, width_x=15.0, width_y=15.0)
@@ -194,15 +138,10 @@ log.py_printf('NORMAL', 'Creating geometry...')
 
 geometry = Geometry()
 geometry.setCmfd(cmfd)
-for material in materials.values(): geometry.addMaterial(material)
-for cell in cells: geometry.addCell(cell)
-geometry.addLattice(assembly1)
-geometry.addLattice(assembly2)
-geometry.addLattice(assembly3)
-geometry.addLattice(assembly4)
-geometry.addLattice(assembly5)
-geometry.addLattice(assembly6)
-geometry.addLattice(core)
+geometry.addMaterials(list(materials.values()))
+geometry.addCells(cells)
+geometry.addLattices([assembly1, assembly2, assembly3, assembly4,
+                      assembly5, assembly6, core])
 
 geometry.initializeFlatSourceRegions()
 
@@ -232,6 +171,7 @@ solver.printTimerReport()
 
 log.py_printf('NORMAL', 'Plotting data...')
 
+#import openmoc.plotter as plotter
 #plotter.plot_tracks(track_generator)
 #plotter.plot_materials(geometry, gridsize=500)
 #plotter.plot_cells(geometry, gridsize=500)
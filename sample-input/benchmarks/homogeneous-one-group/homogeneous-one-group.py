@@ -1,125 +1,183 @@
-import numpy
 from openmoc import *
 import openmoc.log as log
-import openmoc.plotter as plotter
 from openmoc.options import Options
 
 
-###############################################################################
-#######################   Main Simulation Parameters   ########################
-###############################################################################
+## @var _geometry
+#  @brief The Geometry built by create_geometry() along with its Materials,
+#         Surfaces, Cells and Lattices, or None until it has been created.
+#         SWIG frees each C++ object along with its Python proxy, and the
+#         Geometry only holds raw pointers to them, so they are kept alive
+#         here for as long as the Geometry is in use.
+_geometry = None
 
-options = Options()
+## @var _track_generators
+#  @brief The (Geometry, TrackGenerator) pairs built by generate_tracks(),
+#         keyed by the number of azimuthal angles and the track spacing.
+_track_generators = {}
 
-num_threads = options.getNumThreads()
-track_spacing = options.getTrackSpacing()
-num_azim = options.getNumAzimAngles()
-tolerance = options.getTolerance()
-max_iters = options.getMaxIterations()
 
-log.set_log_level('NORMAL')
+##
+# @brief Creates the Geometry for the infinite medium.
+# @details The Geometry is only built on the first call and is reused by any
+#          later calls within the same process.
+# @return the Geometry
+def create_geometry():
 
-log.py_printf('TITLE', 'Simulating a one group homogeneous infinite medium...')
-log.py_printf('HEADER', 'The reference keff = 1.43...')
+  global _geometry
 
+  if _geometry is not None:
+    return _geometry['geometry']
 
-###############################################################################
-#######################   Main Simulation Parameters   ########################
-###############################################################################
+  #############################################################################
+  ############################   Creating Materials   #########################
+  #############################################################################
 
-log.py_printf('NORMAL', 'Creating materials...')
+  log.py_printf('NORMAL', 'Creating materials...')
 
-infinite_medium = Material(1)
-infinite_medium.setNumEnergyGroups(1)
-infinite_medium.setSigmaA(numpy.array([0.069389522]))
-infinite_medium.setSigmaF(numpy.array([0.0414198575]))
-infinite_medium.setNuSigmaF(numpy.array([0.0994076580]))
-infinite_medium.setSigmaS(numpy.array([0.383259177]))
-infinite_medium.setChi(numpy.array([1.0]))
-infinite_medium.setSigmaT(numpy.array([0.452648699]))
+  infinite_medium = Material(1)
+  infinite_medium.setNumEnergyGroups(1)
+  infinite_medium.setSigmaAByGroup(0.069389522, 1)
+  infinite_medium.setSigmaFByGroup(0.0414198575, 1)
+  infinite_medium.setNuSigmaFByGroup(0.0994076580, 1)
+  infinite_medium.setSigmaSByGroup(0.383259177, 1, 1)
+  infinite_medium.setChiByGroup(1.0, 1)
+  infinite_medium.setSigmaTByGroup(0.452648699, 1)
 
 
-###############################################################################
-###########################   Creating Surfaces   #############################
-###############################################################################
+  #############################################################################
+  ###########################   Creating Surfaces   ###########################
+  #############################################################################
 
-log.py_printf('NORMAL', 'Creating surfaces...')
+  log.py_printf('NORMAL', 'Creating surfaces...')
 
-circle = Circle(x=0.0, y=0.0, radius=10.0)
-left = XPlane(x=-100.0)
-right = XPlane(x=100.0)
-top = YPlane(y=100.0)
-bottom = YPlane(y=-100.0)
+  circle = Circle(x=0.0, y=0.0, radius=10.0)
+  left = XPlane(x=-100.0)
+  right = XPlane(x=100.0)
+  top = YPlane(y=100.0)
+  bottom = YPlane(y=-100.0)
 
-left.setBoundaryType(REFLECTIVE)
-right.setBoundaryType(REFLECTIVE)
-top.setBoundaryType(REFLECTIVE)
-bottom.setBoundaryType(REFLECTIVE)
+  left.setBoundaryType(REFLECTIVE)
+  right.setBoundaryType(REFLECTIVE)
+  top.setBoundaryType(REFLECTIVE)
+  bottom.setBoundaryType(REFLECTIVE)
 
 
-###############################################################################
-#############################   Creating Cells   ##############################
-###############################################################################
+  #############################################################################
+  #############################   Creating Cells   ############################
+  #############################################################################
 
-log.py_printf('NORMAL', 'Creating cells...')
+  log.py_printf('NORMAL', 'Creating cells...')
 
-cells = []
-cells.append(CellBasic(universe=1, material=1, rings=2, sectors=4))
-cells.append(CellBasic(universe=1, material=1))
-cells.append(CellFill(universe=0, universe_fill=2))
+  cells = []
+  cells.append(CellBasic(universe=1, material=1, rings=2, sectors=4))
+  cells.append(CellBasic(universe=1, material=1))
+  cells.append(CellFill(universe=0, universe_fill=2))
 
-cells[0].addSurface(halfspace=-1, surface=circle)
-cells[1].addSurface(halfspace=+1, surface=circle)
-cells[2].addSurface(halfspace=+1, surface=left)
-cells[2].addSurface(halfspace=-1, surface=right)
-cells[2].addSurface(halfspace=+1, surface=bottom)
-cells[2].addSurface(halfspace=-1, surface=top)
+  cells[0].addSurface(halfspace=-1, surface=circle)
+  cells[1].addSurface(halfspace=+1, surface=circle)
+  cells[2].addSurfaces([(+1, left), (-1, right), (+1, bottom), (-1, top)])
 
 
-###############################################################################
-###########################   Creating Lattices   #############################
-###############################################################################
+  #############################################################################
+  ###########################   Creating Lattices   ###########################
+  #############################################################################
 
-log.py_printf('NORMAL', 'Creating simple pin cell lattice...')
+  log.py_printf('NORMAL', 'Creating simple pin cell lattice...')
 
-lattice = Lattice(id=2, width_x=200.0, width_y=200.0)
-lattice.setLatticeCells([[1]])
+  lattice = Lattice(id=2, width_x=200.0, width_y=200.0)
+  lattice.setLatticeCells([[1]])
 
 
-###############################################################################
-##########################   Creating the Geometry   ##########################
-###############################################################################
+  #############################################################################
+  ##########################   Creating the Geometry   ########################
+  #############################################################################
 
-log.py_printf('NORMAL', 'Creating geometry...')
+  log.py_printf('NORMAL', 'Creating geometry...')
 
-geometry = Geometry()
-geometry.addMaterial(infinite_medium)
-geometry.addCell(cells[0])
-geometry.addCell(cells[1])
-geometry.addCell(cells[2])
-geometry.addLattice(lattice)
+  geometry = Geometry()
+  geometry.addMaterial(infinite_medium)
+  geometry.addCells(cells)
+  geometry.addLattice(lattice)
 
-geometry.initializeFlatSourceRegions()
+  geometry.initializeFlatSourceRegions()
 
+  _geometry = {'geometry': geometry,
+               'materials': [infinite_medium],
+               'surfaces': [circle, left, right, top, bottom],
+               'cells': cells,
+               'lattices': [lattice]}
 
-###############################################################################
-########################   Creating the TrackGenerator   ######################
-###############################################################################
+  return geometry
 
-log.py_printf('NORMAL', 'Initializing the track generator...')
 
-track_generator = TrackGenerator(geometry, num_azim, track_spacing)
-track_generator.generateTracks()
+##
+# @brief Generates the tracks for the infinite medium Geometry.
+# @details The Geometry and TrackGenerator are cached by the number of
+#          azimuthal angles and the track spacing so that repeated runs with
+#          the same parameters do not regenerate and segment the tracks.
+# @param num_azim the number of azimuthal angles
+# @param track_spacing the spacing between tracks (cm)
+# @return the Geometry and the TrackGenerator
+def generate_tracks(num_azim, track_spacing):
 
+  #############################################################################
+  ########################   Creating the TrackGenerator   ####################
+  #############################################################################
 
-###############################################################################
-###########################   Running a Simulation   ##########################
-###############################################################################
+  key = (num_azim, track_spacing)
 
-solver = CPUSolver(geometry, track_generator)
-solver.setNumThreads(num_threads)
-solver.setSourceConvergenceThreshold(tolerance)
-solver.convergeSource(max_iters)
-solver.printTimerReport()
+  if key in _track_generators:
+    return _track_generators[key]
 
-log.py_printf('TITLE', 'Finished')
+  geometry = create_geometry()
+
+  log.py_printf('NORMAL', 'Initializing the track generator...')
+
+  track_generator = TrackGenerator(geometry, num_azim, track_spacing)
+  track_generator.generateTracks()
+  _track_generators[key] = (geometry, track_generator)
+
+  return geometry, track_generator
+
+
+##
+# @brief Runs the one group homogeneous infinite medium benchmark.
+def main():
+
+  #############################################################################
+  #######################   Main Simulation Parameters   ######################
+  #############################################################################
+
+  options = Options()
+
+  num_threads = options.getNumThreads()
+  track_spacing = options.getTrackSpacing()
+  num_azim = options.getNumAzimAngles()
+  tolerance = options.getTolerance()
+  max_iters = options.getMaxIterations()
+
+  log.set_log_level('NORMAL')
+
+  log.py_printf('TITLE', 'Simulating a one group homogeneous ' + \
+                'infinite medium...')
+  log.py_printf('HEADER', 'The reference keff = 1.43...')
+
+
+  #############################################################################
+  ###########################   Running a Simulation   ########################
+  #############################################################################
+
+  geometry, track_generator = generate_tracks(num_azim, track_spacing)
+
+  solver = CPUSolver(geometry, track_generator)
+  solver.setNumThreads(num_threads)
+  solver.setSourceConvergenceThreshold(tolerance)
+  solver.convergeSource(max_iters)
+  solver.printTimerReport()
+
+  log.py_printf('TITLE', 'Finished')
+
+
+if __name__ == '__main__':
+  main()
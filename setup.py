@@ -3,7 +3,8 @@ from distutils.command.build_ext import build_ext
 from distutils.command.build_py import build_py
 from distutils.command.install import install
 from distutils.errors import DistutilsOptionError
-import os, string
+from multiprocessing.pool import ThreadPool
+import os, string, copy, glob, hashlib
 import config
 
 
@@ -39,6 +40,8 @@ class custom_install(install):
     ('cc=', None, "Compiler (gcc, icpc, or bgxlc) for main openmoc module"),
     ('fp=', None, "Floating point precision (single or double) for " + \
                   "main openmoc module"),
+    ('vector-isa=', None, "SIMD instruction set (native, sse, avx2 or " + \
+                          "avx512) targeted by the GNU compiler"),
     ('with-cuda', None, "Build openmoc.cuda module for NVIDIA GPUs"),
     ('with-gcc', None, "Build openmoc.gnu modules using GNU compiler"),
     ('with-icpc', None, "Build openmoc.intel modules using Intel compiler"),
@@ -48,7 +51,8 @@ class custom_install(install):
     ('debug-mode', None, "Build with debugging symbols"),
     ('with-ccache', None, "Build with ccache for rapid recompilation"),
     ('with-papi', None, 'Build modules with PAPI instrumentation'),
-    ('no-numpy', None, 'Build modules without NumPy C API')
+    ('no-numpy', None, 'Build modules without NumPy C API'),
+    ('num-jobs=', None, 'Number of source files to compile in parallel')
   ]
 
   # Include all of the default options provided by distutils for the
@@ -91,6 +95,9 @@ class custom_install(install):
     self.cc = 'gcc'
     self.fp = 'single'
 
+    # Default SIMD instruction set targeted by the GNU compiler
+    self.vector_isa = 'native'
+
     # By default, do not build openmoc.gnu.single, openmoc.intel.double, etc
     # extension modules
     self.with_gcc = False
@@ -105,6 +112,7 @@ class custom_install(install):
     self.with_ccache = False
     self.with_papi = False
     self.no_numpy = False
+    self.num_jobs = None
 
 
   def finalize_options(self):
@@ -129,6 +137,18 @@ class custom_install(install):
     config.with_papi = self.with_papi
     config.with_numpy = not self.no_numpy
 
+    # Check that the user specified a valid number of parallel compile jobs
+    if self.num_jobs is not None:
+      try:
+        config.num_jobs = int(self.num_jobs)
+      except ValueError:
+        raise DistutilsOptionError \
+            ('Must supply the num-jobs flag with a positive integer')
+
+      if config.num_jobs < 1:
+        raise DistutilsOptionError \
+            ('Must supply the num-jobs flag with a positive integer')
+
     # Check that the user specified a supported C++ compiler
     if self.cc not in ['gcc', 'icpc', 'bgxlc']:
       raise DistutilsOptionError \
@@ -145,6 +165,14 @@ class custom_install(install):
     else:
       config.fp = self.fp
 
+    # Check that the user specified a supported SIMD instruction set
+    if self.vector_isa not in ['native', 'sse', 'avx2', 'avx512']:
+      raise DistutilsOptionError \
+          ('Must supply the vector-isa flag with one of the supported ' +
+           'instruction sets: native, sse, avx2, avx512')
+    else:
+      config.vector_isa = self.vector_isa
+
     # Build the openmoc.gnu.single and/or openmoc.gnu.double
     # extension module(s)
     if self.with_gcc:
@@ -224,20 +252,24 @@ def customize_compiler(self):
   # Inform the compiler it can processes .cu CUDA source files
   self.src_extensions.append('.cu')
 
-  # Save reference to the default _compile method
-  super_compile = self._compile
+  # Save reference to the default _compile method of the compiler class
+  super_compile = self.__class__._compile
 
   # Redefine the _compile method. This gets executed for each
   # object but distutils doesn't have the ability to change compilers
   # based on source extension, so we add that functionality here
   def _compile(obj, src, ext, cc_args, extra_postargs, pp_opts):
 
+    # Set the executable on a copy of the compiler since objects may be
+    # compiled concurrently by different compilers (ie, gcc and nvcc)
+    compiler = copy.copy(self)
+
     # If GNU is a defined macro and the source is C++, use gcc
     if '-DGNU' in pp_opts and os.path.splitext(src)[1] == '.cpp':
       if config.with_ccache:
-        self.set_executable('compiler_so', 'ccache gcc')
+        compiler.set_executable('compiler_so', 'ccache gcc')
       else:
-        self.set_executable('compiler_so', 'gcc')
+        compiler.set_executable('compiler_so', 'gcc')
 
       postargs = config.compiler_flags['gcc']
 
@@ -245,18 +277,18 @@ def customize_compiler(self):
     # If INTEL is a defined macro and the source is C++, use icpc
     elif '-DINTEL' in pp_opts and os.path.splitext(src)[1] == '.cpp':
       if config.with_ccache:
-        self.set_executable('compiler_so', 'ccache icpc')
+        compiler.set_executable('compiler_so', 'ccache icpc')
       else:
-        self.set_executable('compiler_so', 'icpc')
+        compiler.set_executable('compiler_so', 'icpc')
 
       postargs = config.compiler_flags['icpc']
 
     # If BGXLC is a defined macro and the source is C++, use bgxlc
     elif '-DBGXLC' in pp_opts and os.path.splitext(src)[1] == '.cpp':
       if config.with_ccache:
-        self.set_executable('compiler_so', 'bgxlc++_r')
+        compiler.set_executable('compiler_so', 'ccache bgxlc++_r')
       else:
-        self.set_executable('compiler_so', 'bgxlc++_r')
+        compiler.set_executable('compiler_so', 'bgxlc++_r')
 
       postargs = config.compiler_flags['bgxlc']
 
@@ -265,9 +297,9 @@ def customize_compiler(self):
     # SWIG-wrapped CUDA code with gcc
     elif '-DCUDA' in pp_opts and os.path.splitext(src)[1] == '.cpp':
       if config.with_ccache:
-        self.set_executable('compiler_so', 'ccache gcc')
+        compiler.set_executable('compiler_so', 'ccache gcc')
       else:
-        self.set_executable('compiler_so', 'gcc')
+        compiler.set_executable('compiler_so', 'gcc')
 
       postargs = config.compiler_flags['gcc']
 
@@ -275,9 +307,9 @@ def customize_compiler(self):
     # If CUDA is a defined macro and the source is CUDA, use nvcc
     elif '-DCUDA' in pp_opts and os.path.splitext(src)[1] == '.cu':
       if config.with_ccache:
-        self.set_executable('compiler_so', 'ccache nvcc')
+        compiler.set_executable('compiler_so', 'ccache nvcc')
       else:
-        self.set_executable('compiler_so', 'nvcc')
+        compiler.set_executable('compiler_so', 'nvcc')
 
       postargs = config.compiler_flags['nvcc']
 
@@ -287,10 +319,35 @@ def customize_compiler(self):
       raise EnvironmentError('Unable to compile ' + str(src))
 
     # Now call distutils-defined _compile method
-    super_compile(obj, src, ext, cc_args, postargs, pp_opts)
+    super_compile(compiler, obj, src, ext, cc_args, postargs, pp_opts)
+
+  # Redefine the compile method to compile each of the objects for an
+  # extension module in parallel rather than one at a time
+  def compile(sources, output_dir=None, macros=None, include_dirs=None,
+              debug=0, extra_preargs=None, extra_postargs=None, depends=None):
+
+    macros, objects, extra_postargs, pp_opts, build = \
+        self._setup_compile(output_dir, macros, include_dirs,
+                            sources, depends, extra_postargs)
+    cc_args = self._get_cc_args(pp_opts, debug, extra_preargs)
+
+    def compile_object(obj):
+      try:
+        src, ext = build[obj]
+      except KeyError:
+        return
+      self._compile(obj, src, ext, cc_args, extra_postargs, pp_opts)
+
+    pool = ThreadPool(config.num_jobs)
+    pool.map(compile_object, objects)
+    pool.close()
+    pool.join()
+
+    return objects
 
-  # Inject our redefined _compile method into the class
+  # Inject our redefined _compile and compile methods into the class
   self._compile = _compile
+  self.compile = compile
 
 
 def customize_linker(self):
@@ -386,6 +443,57 @@ def customize_linker(self):
   self.link = link
 
 
+def run_swig(interface_file, swig_opts, hash_dir, swig_version):
+  """Generate the SWIG wrap file for an interface file if it is out of date
+
+  The SHA-256 hash of the SWIG version, the SWIG options (including the
+  compiler and NO_NUMPY macros), the interface file and the files it
+  includes is stored under the build directory. SWIG is only run if the
+  hash differs from that of the previous build, or if the generated wrap
+  or Python files are missing.
+  """
+
+  wrap_file = os.path.splitext(interface_file)[0] + '_wrap.cpp'
+  python_file = os.path.splitext(interface_file)[0] + '.py'
+  hash_file = os.path.join(hash_dir, wrap_file + '.sha256')
+
+  # Hash all of the inputs to SWIG
+  swig_inputs = [interface_file, 'openmoc/numpy.i']
+  swig_inputs += sorted(glob.glob('src/*.h') + glob.glob('src/accel/*.h') +
+                        glob.glob('src/accel/cuda/*.h'))
+
+  command = 'swig {0} -o {1} {2}'.format(
+      str.join(' ', swig_opts), wrap_file, interface_file)
+
+  sha256 = hashlib.sha256(swig_version)
+  sha256.update(command.encode())
+
+  for filename in swig_inputs:
+    with open(filename, 'rb') as f:
+      sha256.update(f.read())
+
+  digest = sha256.hexdigest()
+
+  # If the inputs are unchanged since the last build, reuse the wrap file
+  if os.path.exists(wrap_file) and os.path.exists(python_file) and \
+     os.path.exists(hash_file):
+    with open(hash_file, 'r') as f:
+      if f.read() == digest:
+        return
+
+  status = os.system(command)
+
+  # Only record the hash if SWIG succeeded
+  if status == 0:
+    try:
+      os.makedirs(os.path.dirname(hash_file))
+    except OSError:
+      pass
+
+    with open(hash_file, 'w') as f:
+      f.write(digest)
+
+
 # Run the customize_compiler to inject redefined and customized _compile and
 # link methods into distutils
 class custom_build_ext(build_ext):
@@ -400,53 +508,26 @@ class custom_build_ext(build_ext):
     customize_compiler(self.compiler)
     customize_linker(self.compiler)
 
-    os.system('swig {0} -o '.format(str.join(' ', config.swig_flags)) + \
-                'openmoc/openmoc_wrap.cpp openmoc/openmoc.i')
-
-    if 'gcc' in config.cpp_compilers and 'single' in config.fp_precision:
-      os.system('swig {0} -o '.format(str.join(' ', config.swig_flags)) + \
-                  'openmoc/gnu/single/openmoc_gnu_single_wrap.cpp ' + \
-                  'openmoc/gnu/single/openmoc_gnu_single.i')
-
-    if 'gcc' in config.cpp_compilers and 'double' in config.fp_precision:
-      os.system('swig {0} -o '.format(str.join(' ', config.swig_flags)) + \
-                  'openmoc/gnu/double/openmoc_gnu_double_wrap.cpp ' + \
-                  'openmoc/gnu/double/openmoc_gnu_double.i')
-
-    if 'icpc' in config.cpp_compilers and 'single' in config.fp_precision:
-      os.system('swig {0} -o '.format(str.join(' ', config.swig_flags)) + \
-                  'openmoc/intel/single/openmoc_intel_single_wrap.cpp ' + \
-                  'openmoc/intel/single/openmoc_intel_single.i')
-
-    if 'icpc' in config.cpp_compilers and 'double' in config.fp_precision:
-      os.system('swig {0} -o '.format(str.join(' ', config.swig_flags)) + \
-                  'openmoc/intel/double/openmoc_intel_double_wrap.cpp ' + \
-                  'openmoc/intel/double/openmoc_intel_double.i')
-
-    if 'bgxlc' in config.cpp_compilers and 'single' in config.fp_precision:
-      os.system('swig {0} -o '.format(str.join(' ', config.swig_flags)) + \
-                  'openmoc/bgq/single/openmoc_bgq_single_wrap.cpp ' + \
-                  'openmoc/bgq/single/openmoc_bgq_single.i')
-
-    if 'bgxlc' in config.cpp_compilers and 'double' in config.fp_precision:
-      os.system('swig {0} -o '.format(str.join(' ', config.swig_flags)) + \
-                  'openmoc/bgq/double/openmoc_bgq_double_wrap.cpp ' + \
-                  'openmoc/bgq/double/openmoc_bgq_double.i')
-
-    if 'nvcc' in config.cpp_compilers:
-      os.system('swig {0} -o '.format(str.join(' ', config.swig_flags)) + \
-                  'openmoc/cuda/openmoc_cuda_wrap.cpp ' + \
-                  'openmoc/cuda/openmoc_cuda.i')
-
-    if 'nvcc' in config.cpp_compilers and 'single' in config.fp_precision:
-      os.system('swig {0} -o '.format(str.join(' ', config.swig_flags)) + \
-                  'openmoc/cuda/single/openmoc_cuda_single_wrap.cpp ' + \
-                  'openmoc/cuda/single/openmoc_cuda_single.i')
-
-    if 'nvcc' in config.cpp_compilers and 'double' in config.fp_precision:
-      os.system('swig {0} -o '.format(str.join(' ', config.swig_flags)) + \
-                  'openmoc/cuda/double/openmoc_cuda_double_wrap.cpp ' + \
-                  'openmoc/cuda/double/openmoc_cuda_double.i')
+    # The SWIG interface file and options of each extension module, found
+    # from the SWIG-generated wrap file among the module's sources
+    swig_jobs = []
+
+    for extension in self.extensions:
+      for source in extension.sources:
+        if source.endswith('_wrap.cpp'):
+          interface_file = source[:-len('_wrap.cpp')] + '.i'
+          swig_jobs.append((interface_file, extension.swig_opts))
+
+    # The SWIG version is part of each hash since it changes the wrap files
+    swig_version = os.popen('swig -version').read().encode()
+    hash_dir = os.path.join(self.build_temp, 'swig')
+
+    # Run SWIG for each interface file in parallel
+    pool = ThreadPool(config.num_jobs)
+    pool.map(lambda job: run_swig(job[0], job[1], hash_dir, swig_version),
+             swig_jobs)
+    pool.close()
+    pool.join()
 
     build_ext.build_extensions(self)
 
@@ -505,6 +505,14 @@ void CPUSolver::flattenFSRSources(FP_PRECISION value) {
 }
 
 
+/* Only the flux normalization, source update, transport sweep and tally
+ * kernels below are compiled with fast (reassociating) floating point math */
+#if defined(GNU) && !defined(__clang__)
+#pragma GCC push_options
+#pragma GCC optimize("fast-math")
+#endif
+
+
 /**
  * @brief Normalizes all FSR scalar fluxes and Track boundary angular
  *        fluxes to the total fission source (times \f$ \nu \f$).
@@ -1072,3 +1080,8 @@ void CPUSolver::computeFSRFissionRates(double* fission_rates, int num_FSRs) {
 
   return;
 }
+
+
+#if defined(GNU) && !defined(__clang__)
+#pragma GCC pop_options
+#endif
@@ -138,10 +138,31 @@ void Cell::addSurface(int halfspace, Surface* surface) {
     log_printf(ERROR, "Unable to add surface %d to cell %d since the halfspace"
                " %d is not -1 or 1", surface->getId(), _id, halfspace);
 
-  surface_halfspace* new_surf_half = new surface_halfspace;
-  new_surf_half->_surface = surface;
-  new_surf_half->_halfspace = halfspace;
-  _surfaces[surface->getId()] = *new_surf_half;
+  surface_halfspace new_surf_half;
+  new_surf_half._surface = surface;
+  new_surf_half._halfspace = halfspace;
+  _surfaces[surface->getId()] = new_surf_half;
+}
+
+
+/**
+ * @brief Insert several Surfaces into this Cells container.
+ * @details This method is intended to be called from Python to add all of a
+ *          Cell's Surfaces with a single call rather than with one call to
+ *          Cell::addSurface(...) per Surface, as shown in the following example:
+ *
+ * @code
+ *          cell.addSurfaces([(+1, left), (-1, right), (+1, bottom), (-1, top)])
+ * @endcode
+ *
+ * @param surfaces an array of pointers to the Surfaces
+ * @param halfspaces the halfspace (+/-1) of each Surface
+ * @param num_surfaces the number of Surfaces to add
+ */
+void Cell::addSurfaces(Surface** surfaces, int* halfspaces, int num_surfaces) {
+
+  for (int i=0; i < num_surfaces; i++)
+    addSurface(halfspaces[i], surfaces[i]);
 }
 
 
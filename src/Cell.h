@@ -95,6 +95,7 @@ public:
 
   void setUniverse(int universe);
   void addSurface(int halfspace, Surface* surface);
+  void addSurfaces(Surface** surfaces, int* halfspaces, int num_surfaces);
 
   bool cellContainsPoint(Point* point);
   bool cellContainsCoords(LocalCoords* coords);
@@ -635,22 +635,31 @@ void Geometry::addUniverse(Universe* universe) {
  */
 void Geometry::addLattice(Lattice* lattice) {
 
+  /* Collects the unique Universe IDs in the Lattice cells */
+  std::vector< std::vector< std::pair<int, Universe*> > > lattice_universes =
+       lattice->getUniverses();
+  std::set<int> universe_ids;
+
+  for (int i = 0; i < lattice->getNumY(); i++) {
+    for (int j = 0; j < lattice->getNumX(); j++)
+      universe_ids.insert(lattice_universes.at(i).at(j).first);
+  }
+
   /* Sets the Universe pointers for the Lattice and checks if the Lattice
    * contains a Universe which does not exist */
-  for (int i = 0; i < lattice->getNumY(); i++) {
-    for (int j = 0; j < lattice->getNumX(); j++) {
-      int universe_id = lattice->getUniverses().at(i).at(j).first;
-
-      /* If the Universe does not exist */
-      if (_universes.find(universe_id) == _universes.end())
-        log_printf(ERROR, "Attempted to create Lattice containing Universe "
-                   "with ID = %d, but the Geometry does not contain this "
-                   "Universe", lattice->getUniverses().at(i).at(j).first);
-
-      /* Set the Universe pointer */
-      else
-        lattice->setUniversePointer(_universes.at(universe_id));
-    }
+  std::set<int>::iterator iter;
+  for (iter = universe_ids.begin(); iter != universe_ids.end(); ++iter) {
+    int universe_id = *iter;
+
+    /* If the Universe does not exist */
+    if (_universes.find(universe_id) == _universes.end())
+      log_printf(ERROR, "Attempted to create Lattice containing Universe "
+                 "with ID = %d, but the Geometry does not contain this "
+                 "Universe", universe_id);
+
+    /* Set the Universe pointer */
+    else
+      lattice->setUniversePointer(_universes.at(universe_id));
   }
 
   /* Add the Lattice to the Geometry's :attices container */
@@ -669,6 +678,52 @@ void Geometry::addLattice(Lattice* lattice) {
 }
 
 
+/**
+ * @brief Add several Materials to the Geometry.
+ * @details This method is intended to be called from Python to add a list of
+ *          Materials with a single call rather than with one call to
+ *          Geometry::addMaterial(...) per Material, as shown below:
+ *
+ * @code
+ *          geometry.addMaterials(list(materials.values()))
+ * @endcode
+ *
+ * @param materials a vector of pointers to the Material objects
+ */
+void Geometry::addMaterials(std::vector<Material*> materials) {
+
+  for (size_t i=0; i < materials.size(); i++)
+    addMaterial(materials[i]);
+}
+
+
+/**
+ * @brief Add several Cells to the Geometry.
+ * @details The Cells are added in order, as if by successive calls to
+ *          Geometry::addCell(...).
+ * @param cells a vector of pointers to the Cell objects
+ */
+void Geometry::addCells(std::vector<Cell*> cells) {
+
+  for (size_t i=0; i < cells.size(); i++)
+    addCell(cells[i]);
+}
+
+
+/**
+ * @brief Add several Lattices to the Geometry.
+ * @details The Lattices are added in order, as if by successive calls to
+ *          Geometry::addLattice(...). Any Lattice which is filled by another
+ *          Lattice must therefore appear after it in the vector.
+ * @param lattices a vector of pointers to the Lattice objects
+ */
+void Geometry::addLattices(std::vector<Lattice*> lattices) {
+
+  for (size_t i=0; i < lattices.size(); i++)
+    addLattice(lattices[i]);
+}
+
+
 /**
  * @brief Removes a Material from the Geometry.
  * @details Note: this method does not remove the Cells filled by this Material
@@ -18,6 +18,7 @@
 #include "Surface.h"
 #include "Cmfd.h"
 #include <sstream>
+#include <set>
 #include <string>
 #include <omp.h>
 #include <functional>
@@ -178,6 +179,9 @@ public:
   void addCell(Cell *cell);
   void addUniverse(Universe* universe);
   void addLattice(Lattice* lattice);
+  void addMaterials(std::vector<Material*> materials);
+  void addCells(std::vector<Cell*> cells);
+  void addLattices(std::vector<Lattice*> lattices);
 
   /* Remove object methods */
   void removeMaterial(int id);
@@ -372,6 +372,45 @@ FP_PRECISION Material::getSigmaSByGroup(int origin, int destination) {
 }
 
 
+/**
+ * @brief Copies the Material's scattering cross-section matrix into an array.
+ * @details This method is intended to be called from Python to retrieve the
+ *          complete scattering matrix as a NumPy array with a single call
+ *          rather than with one call to getSigmaSByGroup(...) per element.
+ *          The array is ordered in the same way as that passed to
+ *          Material::setSigmaS(...), so that the scattering matrix makes
+ *          the round trip unchanged, as shown in the following example:
+ *
+ * @code
+ *          num_groups = material.getNumEnergyGroups()
+ *          material.setSigmaS(sigma_s)
+ *          assert numpy.allclose(material.retrieveSigmaS(num_groups**2),
+ *                                sigma_s)
+ * @endcode
+ *
+ * @param sigma_s an array to populate with the scattering cross-sections
+ * @param num_xs the number of scattering cross-sections (groups squared)
+ */
+void Material::retrieveSigmaS(double* sigma_s, int num_xs) {
+  if (_sigma_s == NULL)
+    log_printf(ERROR, "Unable to retrieve Material %d's scattering "
+               "cross section since it has not yet been set", _id);
+
+  if (num_xs != _num_groups * _num_groups)
+    log_printf(ERROR, "Unable to retrieve %d scattering cross sections for "
+               "Material %d which contains %d energy groups",
+               num_xs, _id, _num_groups);
+
+  for (int destination=0; destination < _num_groups; destination++) {
+    for (int origin=0; origin < _num_groups; origin++)
+      sigma_s[origin*_num_groups + destination] =
+           getSigmaSByGroupInline(origin, destination);
+  }
+
+  return;
+}
+
+
 /**
  * @brief Get the Material's fission cross section for some energy group.
  * @param group the energy group
@@ -16,12 +16,16 @@
 #include "log.h"
 #endif
 
-#ifdef ICPC
-/** Word-aligned memory allocation for Intel's compiler */
+#if defined(__x86_64__) || defined(__i386__)
+#ifdef __cplusplus
+#include <mm_malloc.h>
+#endif
+
+/** Word-aligned memory allocation for x86 compilers (ie, GNU and Intel) */
 #define MM_FREE(array) _mm_free(array)
 
-/** Word-aligned memory allocation for Intel's compiler */
-#define MM_MALLOC(size,alignment) _mm_alloc(size, alignment)
+/** Word-aligned memory allocation for x86 compilers (ie, GNU and Intel) */
+#define MM_MALLOC(size,alignment) _mm_malloc(size, alignment)
 
 #else
 
@@ -132,6 +136,7 @@ public:
   FP_PRECISION getBucklingByGroup(int group);
   FP_PRECISION getDifHatByGroup(int group, int surface);
   FP_PRECISION getDifTildeByGroup(int group);  
+  void retrieveSigmaS(double* sigma_s, int num_xs);
   bool isFissionable();
   bool isDataAligned();
   int getNumVectorGroups();
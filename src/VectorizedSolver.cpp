@@ -72,6 +72,11 @@ VectorizedSolver::~VectorizedSolver() {
     _reduced_source = NULL;
   }
 
+  if (_source_residuals != NULL) {
+    MM_FREE(_source_residuals);
+    _source_residuals = NULL;
+  }
+
   if (_thread_taus != NULL) {
     MM_FREE(_thread_taus);
     _thread_taus = NULL;
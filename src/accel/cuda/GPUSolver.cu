@@ -310,10 +310,13 @@ __global__ void computeFissionAndAbsorption(FP_PRECISION* FSR_volumes,
 }
 
 
+#if defined(__CUDA_ARCH__) && __CUDA_ARCH__ < 600
 /**
  * @brief Perform an atomic addition in double precision to an array address
  *        on the GPU.
  * @details This method is straight out of CUDA C Developers Guide (cc 2013).
+ *          It is only needed for GPUs with compute capability below 6.0,
+ *          which do not natively provide a double precision atomicAdd.
  * @param address the array memory address
  * @param val the value to add to the array
  * @return the atomically added array value and input value
@@ -331,6 +334,7 @@ __device__ double atomicAdd(double* address, double val) {
 
   return __longlong_as_double(old);
 }
+#endif
 
 
 /**